@@ -1,6 +1,6 @@
 import uasyncio as asyncio
 
-async def main(sunspec):
+async def main(sunspec, host):
 	print ("Starting Demo")
 
 	sunspec.set_manufacturer('Demo')
@@ -1,17 +1,34 @@
 import struct
 import uasyncio as asyncio
-from umodbus.serial import Serial as ModbusRTUMaster
 
-def s32l(*args):
-	return struct.unpack('<i', struct.pack('<2H', *args))[0]
+# Largest number of registers the meter will return in a single request
+MAX_READ_REGISTERS = 0x40
 
-async def main(sunspec):
+# Register ranges used from the meter, as (start, end). Registers in the
+# gap between them are never used.
+SPANS = ((0x00, 0x12), (0x28, 0x40))
+
+def s32l(lo, hi):
+	v = (hi << 16) | lo
+	return v - 0x100000000 if v & 0x80000000 else v
+
+async def read_registers(read):
+	# Read all SPANS in as few requests as the meter allows, since each one
+	# is a full bus round-trip. The result is indexed by register address.
+	end = SPANS[-1][1]
+	if end <= MAX_READ_REGISTERS:
+		return await read(1, 0, end, signed=False)
+
+	registers = [0] * end
+	for lo, hi in SPANS:
+		for addr in range(lo, hi, MAX_READ_REGISTERS):
+			n = min(MAX_READ_REGISTERS, hi - addr)
+			registers[addr:addr+n] = await read(1, addr, n, signed=False)
+	return registers
+
+async def main(sunspec, host):
 	print ("Starting Modbus-RTU")
-	host = ModbusRTUMaster(
-		baudrate=9600,
-		pins = (17, 16),
-		uart_id = 1,
-		ctrl_pin = 4)
+	read = host.read_input_registers
 
 	timeout = 3
 
@@ -21,7 +38,7 @@ async def main(sunspec):
 	# Read serial number
 	while True:
 		try:
-			registers = host.read_input_registers(1, 0x1300, 7, signed=False)
+			registers = await read(1, 0x1300, 7, signed=False)
 		except OSError:
 			print("No response, retrying...")
 			await asyncio.sleep(10)
@@ -37,24 +54,17 @@ async def main(sunspec):
 	timeout = 3
 	while True:
 		try:
-			# EM24 registers
-			registers = host.read_input_registers(1, 0, 6, signed=False)
-			voltage = s32l(*registers[0:2])
-			sunspec.set_voltage(0, voltage)
-			sunspec.set_voltage(1, s32l(*registers[2:4]))
-			sunspec.set_voltage(2, s32l(*registers[4:6]))
-
-			registers = host.read_input_registers(1, 0x0C, 6, signed=False)
-			sunspec.set_current(0, s32l(*registers[0:2]))
-			sunspec.set_current(1, s32l(*registers[2:4]))
-			sunspec.set_current(2, s32l(*registers[4:6]))
+			registers = await read_registers(read)
 
-			power = s32l(*host.read_input_registers(1, 0x28, 2, signed=False))
-			sunspec.set_power(power)
+			voltage = s32l(*registers[0:2])
+			power = s32l(*registers[0x28:0x2A])
+			sunspec.update_phase_data(
+				(voltage, s32l(*registers[2:4]), s32l(*registers[4:6])),
+				(s32l(*registers[0x0C:0x0E]), s32l(*registers[0x0E:0x10]),
+					s32l(*registers[0x10:0x12])),
+				power,
+				s32l(*registers[0x3E:0x40]))
 			sunspec.set_state(4 if power > 0 else 2) # MPPT/Sleeping
-
-			sunspec.set_energy(
-				s32l(*host.read_input_registers(1, 0x3E, 2, signed=False)))
 			print (voltage*0.1)
 		except OSError:
 			# No data from slave
@@ -1,10 +1,14 @@
-import time
+import gc
 import json
 import uasyncio as asyncio
 import network
 from machine import Pin
+from umodbus.serial import Serial as ModbusRTUMaster
 import web
 
+# Status LED, shared with the sunspec service
+led = Pin(2, mode=Pin.OUT)
+
 def get_config():
 	try:
 		with open("config.json", "r") as fp:
@@ -17,16 +21,15 @@ def get_config():
 		except KeyError:
 			return None, None, None, None, None
 
-def main():
+async def _boot():
 	# Wait before boot, and check GPIO0. If it is pulled down, then
 	# skip network config and enable AP.
 	enable_ap = False
-	led = Pin(2, mode=Pin.OUT)
 	button = Pin(0, mode=Pin.IN, pull=Pin.PULL_UP)
 	for i in range(15):
 		led.value(not led.value())
 		enable_ap = enable_ap or (button.value() == 0)
-		time.sleep(0.2)
+		await asyncio.sleep(0.2)
 
 	# Wlan connection details, and maximum power
 	ap, pw, maxpower, inmod, outmod = get_config()
@@ -45,10 +48,13 @@ def main():
 	# Handle interface already up during a soft-boot
 	if wlan.active() and wlan.isconnected():
 		wlan.disconnect()
-		time.sleep(1)
+		await asyncio.sleep(1)
 
 	wlan.active(True)
 
+	# Serve the web interface while we wait for the network
+	webserver = asyncio.create_task(web.main())
+
 	if enable_ap:
 		wlan.config(essid="SunspecBridge")
 		while True:
@@ -56,7 +62,7 @@ def main():
 			if wlan.active():
 				print("AP available as {}".format(wlan.ifconfig()[0]))
 				break
-			time.sleep(2)
+			await asyncio.sleep(2)
 	else:
 		wlan.connect(ap, pw)
 		while True:
@@ -64,7 +70,7 @@ def main():
 			if wlan.isconnected():
 				print("Connected to WiFi as {}".format(wlan.ifconfig()[0]))
 				break
-			time.sleep(2)
+			await asyncio.sleep(2)
 
 	# Import modules
 	try:
@@ -72,16 +78,27 @@ def main():
 		pvinverter = __import__(inmod)
 	except ImportError:
 		print ("Error loading conversion layer!")
-		asyncio.run(web.main())
+		await webserver
 	else:
 		gc.collect()
 		print ("Memory free", gc.mem_free())
 
 		# Main loop
 		print ("Starting main loop")
-		sunspec_service = sunspec.Sunspec()
+		sunspec_service = sunspec.Sunspec(led)
 		sunspec_service.set_maxpower(maxpower)
-		asyncio.run(asyncio.gather(web.main(), sunspec_service.main(), pvinverter.main(sunspec_service)))
+
+		# RTU side, shared with whichever inverter module is loaded
+		rtu = ModbusRTUMaster(
+			baudrate=9600,
+			pins = (17, 16),
+			uart_id = 1,
+			ctrl_pin = 4)
+
+		await asyncio.gather(webserver, sunspec_service.main(), pvinverter.main(sunspec_service, rtu))
+
+def main():
+	asyncio.run(_boot())
 
 if __name__ == "__main__":
 	main()
@@ -0,0 +1,5 @@
+# Freeze the modbus stack into the firmware, so that its bytecode runs
+# from flash rather than taking up heap. Build with:
+#   make -C ports/esp32 FROZEN_MANIFEST=/path/to/sunspecbridge/manifest.py
+include("$(PORT_DIR)/boards/manifest.py")
+package("umodbus")
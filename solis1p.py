@@ -1,17 +1,25 @@
-import struct
 import uasyncio as asyncio
-from umodbus.serial import Serial as ModbusRTUMaster
 
-def u32b(*args):
-	return struct.unpack('>I', struct.pack('>2H', *args))[0]
+_HEX = b'0123456789abcdef'
 
-async def main(sunspec):
+def u32b(hi, lo):
+	return (hi << 16) | lo
+
+def decode_serial(regs):
+	# Each register holds hex digits of the serial, least significant
+	# nibble first.
+	buf = bytearray()
+	for x in regs:
+		while True:
+			buf.append(_HEX[x & 0xF])
+			x >>= 4
+			if not x:
+				break
+	return buf.decode()
+
+async def main(sunspec, host):
 	print ("Starting Solis1P Modbus-RTU")
-	host = ModbusRTUMaster(
-		baudrate=9600,
-		pins = (17, 16),
-		uart_id = 1,
-		ctrl_pin = 4)
+	read = host.read_input_registers
 
 	timeout = 3
 
@@ -21,15 +29,14 @@ async def main(sunspec):
 	while True:
 		try:
 			# Read serial number
-			sregs = host.read_input_registers(1, 3060, 4, signed=False)
-			vregs = host.read_input_registers(1, 3000, 1, signed=False)
+			sregs = await read(1, 3060, 4, signed=False)
+			vregs = await read(1, 3000, 1, signed=False)
 		except OSError:
 			print("No modbus-RTU response, retrying...")
 			await asyncio.sleep(10)
 			continue
 		else:
-			serial = "".join(["".join(reversed("{:x}".format(x))) for x in sregs])
-			sunspec.set_serial(serial)
+			sunspec.set_serial(decode_serial(sregs))
 			sunspec.set_version("{:x}".format(vregs[0]))
 			break
 
@@ -38,20 +45,20 @@ async def main(sunspec):
 	while True:
 		try:
 			# Solis registers
-			registers = host.read_input_registers(1, 3035, 2, signed=False)
+			registers = await read(1, 3035, 2, signed=False)
 			sunspec.set_voltage(0, registers[0])
 			sunspec.set_current(0, registers[1])
 
-			power = u32b(*host.read_input_registers(1, 3004, 2, signed=False))
+			power = u32b(*await read(1, 3004, 2, signed=False))
 			sunspec.set_power(power)
 			sunspec.set_state(4 if power > 0 else 2) # MPPT/Sleeping
 
 			sunspec.set_energy(
-				u32b(*host.read_input_registers(1, 3008, 2, signed=False))*1000)
+				u32b(*await read(1, 3008, 2, signed=False))*1000)
 
 			# Update power limit
 			limit = sunspec.powerlimit()
-			host.write_single_register(1, 3049,
+			await host.write_single_register(1, 3049,
 				10000 if limit is None else limit * 100)
 
 		except OSError:
@@ -1,16 +1,32 @@
 import struct
 from collections import namedtuple
-import uasyncio as asyncio
-from machine import Pin
 from umodbus.tcp import ModbusTCP
 
 register = namedtuple('register', ('register', 'len', 'val'))
 
+# Registers written by update_phase_data, in argument order
+_PHASE_REGS = (
+	40080, 40081, 40082, # Volts AN, BN, CN
+	40073, 40074, 40075, # Amps A, B, C
+	40084, # Total power
+	40094, 40095) # 32-bit energy counter
+
+# Registers cleared by reset, and the values they are reset to
+_RESET_REGS = (40080, 40081, 40082, 40073, 40074, 40075, 40084, 40108)
+_RESET_VALS = (0, 0, 0, 0, 0, 0, 0, 1) # State OFF
+
+# Encoded registers for each (string, length) seen so far. The strings are
+# static or set once at startup, so this stays small.
+_ENCODE_CACHE = {}
+
 def encode_string(s, length):
-	s = s.encode('ascii')
-	pad = b'\0' * (2 * length - len(s))
-	fmt = '>{}H'.format(length)
-	return struct.unpack(fmt, s + pad)
+	key = (s, length)
+	v = _ENCODE_CACHE.get(key)
+	if v is None:
+		b = s.encode('ascii')
+		pad = b'\0' * (2 * length - len(b))
+		v = _ENCODE_CACHE[key] = struct.unpack('>{}H'.format(length), b + pad)
+	return v
 
 def regs():
 	return [
@@ -73,42 +89,51 @@ def regs():
 	]
 
 class Sunspec(object):
-	def __init__(self):
-		self.client = ModbusTCP(default_value=0xFFFF)
+	def __init__(self, led):
+		self._led = led
+		self.client = ModbusTCP(default_value=0xFFFF,
+			base_addr=40000, size=180)
 
 	def set_voltage(self, phase, value):
-		self.client.set_hreg(40080+phase, value)
+		self.client.set_hreg_scalar(40080+phase, value)
 
 	def set_current(self, phase, value):
-		self.client.set_hreg(40073+phase, value)
+		self.client.set_hreg_scalar(40073+phase, value)
 	
 	def set_power(self, value):
-		self.client.set_hreg(40084, value)
+		self.client.set_hreg_scalar(40084, value)
 
 	def set_energy(self, value):
-		self.client.set_hreg(40094, (value>>16,  value & 0xFFFF))
+		self.client.set_hreg_block(40094, (value>>16,  value & 0xFFFF))
 	
+	def update_phase_data(self, voltages, currents, power, energy):
+		self.client.set_hregs(_PHASE_REGS, (
+			voltages[0], voltages[1], voltages[2],
+			currents[0], currents[1], currents[2],
+			power,
+			energy >> 16, energy & 0xFFFF))
+
 	def set_state(self, value):
-		self.client.set_hreg(40108, value)
+		self.client.set_hreg_scalar(40108, value)
 
 	def set_manufacturer(self, value):
-		self.client.set_hreg(40004, encode_string(value, 16))
+		self.client.set_hreg_block(40004, encode_string(value, 16))
 
 	def set_model(self, value):
-		self.client.set_hreg(40020, encode_string(value, 16))
+		self.client.set_hreg_block(40020, encode_string(value, 16))
 
 	def set_version(self, value):
-		self.client.set_hreg(40044, encode_string(value, 8))
+		self.client.set_hreg_block(40044, encode_string(value, 8))
 
 	def set_serial(self, value):
-		self.client.set_hreg(40052, encode_string(value, 16))
+		self.client.set_hreg_block(40052, encode_string(value, 16))
 
 	def set_maxpower(self, value):
-		self.client.set_hreg(40125, value)
+		self.client.set_hreg_scalar(40125, value)
 
 	def set_enabled(self, enabled):
 		# Put SunSpec marker (SunS) at 40000
-		self.client.set_hreg(40000, (0x5375, 0x6e53) if enabled else (0, 0))
+		self.client.set_hreg_block(40000, (0x5375, 0x6e53) if enabled else (0, 0))
 
 	def powerlimit(self):
 		ena = self.client.get_hreg(40159)
@@ -117,24 +142,14 @@ class Sunspec(object):
 		return None
 
 	def reset(self):
-		self.set_voltage(0, 0); self.set_voltage(1, 0); self.set_voltage(2, 0);
-		self.set_current(0, 0); self.set_current(1, 0); self.set_current(2, 0);
-		self.set_power(0)
-		self.set_state(1) # OFF
+		self.client.set_hregs(_RESET_REGS, _RESET_VALS)
 
 	async def main(self):
 		print ("Starting Sunspec 2017")
 
-		led = Pin(2, mode=Pin.OUT)
-
-		self.client.bind(local_ip='0.0.0.0', local_port=502)
 		self.client.setup_registers(registers=regs())
 
-		while True:
-			try:
-				# Turn on LED whenever modbus request is processed
-				led.value(self.client.process())
-			except Exception as e:
-				print('Exception during execution: {}'.format(e))
-
-			await asyncio.sleep(0) # Yield control
+		# Requests are handled as they arrive, with the LED lit while
+		# one is being processed
+		await self.client.serve(local_ip='0.0.0.0', local_port=502,
+			activity=self._led.value)
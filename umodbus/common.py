@@ -35,19 +35,19 @@ class Request(object):
             self.data = None
         elif self.function == Const.WRITE_SINGLE_REGISTER:
             self.quantity = None
-            self.data = data[4:6]
+            self.data = memoryview(data)[4:6]
             # all values allowed
         elif self.function == Const.WRITE_MULTIPLE_REGISTERS:
             self.quantity = struct.unpack_from('>H', data, 4)[0]
             if self.quantity < 0x0001 or self.quantity > 0x007B:
                 raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
-            self.data = data[7:]
+            self.data = memoryview(data)[7:]
             if len(self.data) != self.quantity * 2:
                 raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
         else:
             # Not implemented functions
             self.quantity = None
-            self.data = data[4:]
+            self.data = memoryview(data)[4:]
 
     def send_response(self,
                       values: Optional[list] = None,
@@ -92,11 +92,11 @@ class CommonModbusFunctions(object):
     def __init__(self):
         pass
 
-    def read_holding_registers(self,
-                               slave_addr: int,
-                               starting_addr: int,
-                               register_qty: int,
-                               signed: bool = True) -> Tuple[int, ...]:
+    async def read_holding_registers(self,
+                                     slave_addr: int,
+                                     starting_addr: int,
+                                     register_qty: int,
+                                     signed: bool = True) -> Tuple[int, ...]:
         """
         Read holding registers (HREGS).
 
@@ -116,19 +116,19 @@ class CommonModbusFunctions(object):
             starting_address=starting_addr,
             quantity=register_qty)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=True)
+        response = await self._send_receive(slave_addr=slave_addr,
+                                            modbus_pdu=modbus_pdu,
+                                            count=True)
 
         register_value = functions.to_short(byte_array=response, signed=signed)
 
         return register_value
 
-    def read_input_registers(self,
-                             slave_addr: int,
-                             starting_addr: int,
-                             register_qty: int,
-                             signed: bool = True) -> Tuple[int, ...]:
+    async def read_input_registers(self,
+                                   slave_addr: int,
+                                   starting_addr: int,
+                                   register_qty: int,
+                                   signed: bool = True) -> Tuple[int, ...]:
         """
         Read input registers (IREGS).
 
@@ -148,19 +148,19 @@ class CommonModbusFunctions(object):
             starting_address=starting_addr,
             quantity=register_qty)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=True)
+        response = await self._send_receive(slave_addr=slave_addr,
+                                            modbus_pdu=modbus_pdu,
+                                            count=True)
 
         register_value = functions.to_short(byte_array=response, signed=signed)
 
         return register_value
 
-    def write_single_register(self,
-                              slave_addr: int,
-                              register_address: int,
-                              register_value: int,
-                              signed: bool = True) -> bool:
+    async def write_single_register(self,
+                                    slave_addr: int,
+                                    register_address: int,
+                                    register_value: int,
+                                    signed: bool = True) -> bool:
         """
         Update a single register.
 
@@ -181,9 +181,9 @@ class CommonModbusFunctions(object):
             register_value=register_value,
             signed=signed)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=False)
+        response = await self._send_receive(slave_addr=slave_addr,
+                                            modbus_pdu=modbus_pdu,
+                                            count=False)
 
         if response is None:
             return False
@@ -197,11 +197,11 @@ class CommonModbusFunctions(object):
 
         return operation_status
 
-    def write_multiple_registers(self,
-                                 slave_addr: int,
-                                 starting_address: int,
-                                 register_values: List[int],
-                                 signed: bool = True) -> bool:
+    async def write_multiple_registers(self,
+                                       slave_addr: int,
+                                       starting_address: int,
+                                       register_values: List[int],
+                                       signed: bool = True) -> bool:
         """
         Update multiple registers.
 
@@ -222,9 +222,9 @@ class CommonModbusFunctions(object):
             register_values=register_values,
             signed=signed)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=False)
+        response = await self._send_receive(slave_addr=slave_addr,
+                                            modbus_pdu=modbus_pdu,
+                                            count=False)
 
         if response is None:
             return False
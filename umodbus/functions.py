@@ -173,8 +173,9 @@ def response(function_code: int,
     :type       request_register_qty:   int
     :param      request_data:           The request data
     :type       request_data:           list
-    :param      value_list:             The values
-    :type       value_list:             Optional[list]
+    :param      value_list:             The values, or the big-endian
+                                            register bytes
+    :type       value_list:             Optional[Union[list, bytes]]
     :param      signed:                 Indicates if signed
     :type       signed:                 bool
 
@@ -183,6 +184,15 @@ def response(function_code: int,
     """
     if function_code in [Const.READ_HOLDING_REGISTERS,
                            Const.READ_INPUT_REGISTER]:
+        if isinstance(value_list, (bytes, bytearray, memoryview)):
+            # already packed big-endian, as kept by the register store
+            if not (0x0001 <= len(value_list) // 2 <= 0x007D):
+                raise ValueError('invalid number of registers')
+
+            return struct.pack('>BB',
+                               function_code,
+                               len(value_list)) + value_list
+
         quantity = len(value_list)
 
         if not (0x0001 <= quantity <= 0x007D):
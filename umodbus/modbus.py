@@ -13,6 +13,7 @@ This class is inherited by the Modbus client implementations
 """
 
 # system packages
+import micropython
 import time
 
 # custom packages
@@ -21,7 +22,7 @@ from . import const as Const
 from .common import Request
 
 # typing not natively supported on MicroPython
-from .typing import Callable, dict_keys, List, Optional, Union
+from .typing import Callable, dict_keys, List, Optional, Tuple, Union
 
 
 class Modbus(object):
@@ -32,13 +33,73 @@ class Modbus(object):
     :type       itf:        Callable
     :param      addr_list:  List of addresses
     :type       addr_list:  List[int]
+    :param      base_addr:  First register address of the store
+    :type       base_addr:  int
+    :param      size:       Number of registers in the store, inferred by
+                            :py:meth:`setup_registers` if zero
+    :type       size:       int
+
+    With the default size of zero there is no store until
+    :py:meth:`setup_registers` runs, and setting a register before then
+    raises KeyError.
     """
-    def __init__(self, itf, addr_list: List[int], default_value=None) -> None:
+    def __init__(self,
+                 itf,
+                 addr_list: List[int],
+                 default_value=None,
+                 base_addr: int = 0,
+                 size: int = 0) -> None:
         self._itf = itf
         self._addr_list = addr_list
         self.default_value = default_value
-        self._register_dict = dict()
+        self._allocate(base_addr, size)
 
+    def _allocate(self, base_addr: int, size: int) -> None:
+        """
+        Allocate a dense register store.
+
+        :param      base_addr:  First register address of the store
+        :type       base_addr:  int
+        :param      size:       Number of registers in the store
+        :type       size:       int
+        """
+        fill = 0xFFFF if self.default_value is None else self.default_value
+        self._base = base_addr
+        self._size = size
+        # registers are kept big-endian, exactly as they go on the wire
+        self._regs = bytearray(bytes((fill >> 8, fill & 0xFF)) * size)
+        # one byte per register, set once the register has been written
+        self._present = bytearray(size)
+
+    def _index(self, address: int) -> int:
+        """
+        Get the store index of a register address.
+
+        :param      address:  The address (ID) of the register
+        :type       address:  int
+
+        :returns:   Index into the register store, -1 if out of range
+        :rtype:     int
+        """
+        idx = address - self._base
+        if 0 <= idx < self._size:
+            return idx
+        return -1
+
+    def _has_hreg(self, address: int) -> bool:
+        """
+        Check whether a register has been set.
+
+        :param      address:  The address (ID) of the register
+        :type       address:  int
+
+        :returns:   True if the register has a value, False otherwise
+        :rtype:     bool
+        """
+        idx = self._index(address)
+        return idx >= 0 and self._present[idx] != 0
+
+    @micropython.native
     def process(self) -> bool:
         """
         Process the Modbus requests.
@@ -46,13 +107,25 @@ class Modbus(object):
         :returns:   Result of processing, True on success, False otherwise
         :rtype:     bool
         """
-        req_type = None
-
         request = self._itf.get_request(unit_addr_list=self._addr_list,
                                         timeout=0)
         if request is None:
             return False
 
+        self._process_request(request=request)
+
+        return True
+
+    @micropython.native
+    def _process_request(self, request: Request) -> None:
+        """
+        Process a single Modbus request.
+
+        :param      request:   The request
+        :type       request:   Request
+        """
+        req_type = None
+
         if request.function == Const.READ_HOLDING_REGISTERS:
             # Hregs (setter+getter) [0, 65535]
             # function 03 - read holding register
@@ -71,26 +144,33 @@ class Modbus(object):
         elif req_type == 'WRITE':
             self._process_write_access(request=request)
 
-        return True
-
-    def _create_response(self, request: Request) -> Union[List[bool], List[int]]:
+    @micropython.native
+    def _create_response(self, request: Request) -> Union[memoryview, bytearray]:
         """
         Create a response.
 
         :param      request:   The request
         :type       request:   Request
 
-        :returns:   Values of this register
-        :rtype:     Union[List[bool], List[int]]
+        :returns:   Values of this register, big-endian
+        :rtype:     Union[memoryview, bytearray]
         """
-        data = []
-        default_value = 0xFFFF if self.default_value is None else self.default_value
-        reg_dict = self._register_dict
+        start = request.register_addr - self._base
+        end = start + request.quantity
 
-        for addr in range(request.register_addr,
-                          request.register_addr + request.quantity):
-            value = reg_dict.get(addr, default_value)
-            data.append(value)
+        if start >= 0 and end <= self._size:
+            # a view into the store, no copy
+            data = memoryview(self._regs)[2 * start:2 * end]
+        else:
+            # partially outside the store, pad with the default value
+            default_value = 0xFFFF if self.default_value is None else self.default_value
+            data = bytearray(bytes((default_value >> 8, default_value & 0xFF)) *
+                             request.quantity)
+            lo = max(start, 0)
+            hi = min(end, self._size)
+            if lo < hi:
+                data[2 * (lo - start):2 * (hi - start)] = \
+                    memoryview(self._regs)[2 * lo:2 * hi]
 
         # caution LSB vs MSB
         # [
@@ -121,6 +201,7 @@ class Modbus(object):
 
         return data
 
+    @micropython.native
     def _process_read_access(self, request: Request) -> None:
         """
         Process read access to register
@@ -132,12 +213,13 @@ class Modbus(object):
 
         # If a default value is specified, then we always return a response,
         # so it doesn't matter if the address is not in the store.
-        if self.default_value is not None or address in self._register_dict:
+        if self.default_value is not None or self._has_hreg(address):
             vals = self._create_response(request=request)
-            request.send_response(vals)
+            request.send_response(vals, signed=False)
         else:
             request.send_exception(Const.ILLEGAL_DATA_ADDRESS)
 
+    @micropython.native
     def _process_write_access(self, request: Request) -> None:
         """
         Process write access to register
@@ -148,12 +230,17 @@ class Modbus(object):
         address = request.register_addr
         val = 0
 
-        if address in self._register_dict:
+        if self._has_hreg(address):
             if request.data is None:
                 request.send_exception(Const.ILLEGAL_DATA_VALUE)
                 return
 
-            val = list(functions.to_short(byte_array=request.data, signed=False))
+            val = functions.to_short(byte_array=request.data, signed=False)
+
+            # all written registers must be inside the store
+            if address - self._base + len(val) > self._size:
+                request.send_exception(Const.ILLEGAL_DATA_ADDRESS)
+                return
 
             if request.function in [Const.WRITE_SINGLE_REGISTER,
                                     Const.WRITE_MULTIPLE_REGISTERS]:
@@ -173,12 +260,72 @@ class Modbus(object):
         :type       value:    int or list of int, optional
         """
         if isinstance(value, (list, tuple)):
-            # flatten the list and add single registers only
-            for idx, val in enumerate(value):
-                this_addr = address + idx
-                self._register_dict[this_addr] = val
+            self.set_hreg_block(address, value)
         else:
-            self._register_dict[address] = value
+            self.set_hreg_scalar(address, value)
+
+    def set_hreg_scalar(self, address: int, value: int) -> None:
+        """
+        Set a single holding register value.
+
+        :param      address:  The address (ID) of the register
+        :type       address:  int
+        :param      value:    The value, truncated to 16 bits
+        :type       value:    int
+        """
+        idx = self._index(address)
+        if idx < 0:
+            raise KeyError('Register address {} outside of store'.
+                           format(address))
+        regs = self._regs
+        regs[2 * idx] = (value >> 8) & 0xFF
+        regs[2 * idx + 1] = value & 0xFF
+        self._present[idx] = 1
+
+    def set_hreg_block(self, address: int, values: List[int]) -> None:
+        """
+        Set consecutive holding register values.
+
+        :param      address:  The address (ID) of the first register
+        :type       address:  int
+        :param      values:   The values, each truncated to 16 bits
+        :type       values:   List[int]
+        """
+        start = address - self._base
+        if start < 0 or start + len(values) > self._size:
+            raise KeyError('Register address {} outside of store'.
+                           format(address))
+        regs = self._regs
+        present = self._present
+        for idx, val in enumerate(values, start):
+            regs[2 * idx] = (val >> 8) & 0xFF
+            regs[2 * idx + 1] = val & 0xFF
+            present[idx] = 1
+
+    def set_hregs(self, addresses: Tuple[int, ...],
+                  values: Tuple[int, ...]) -> None:
+        """
+        Set several holding register values in one call.
+
+        Nothing is written if any of the addresses is outside the store.
+
+        :param      addresses:  The register addresses
+        :type       addresses:  Tuple[int, ...]
+        :param      values:     The values, each truncated to 16 bits, in
+                                the same order as the addresses
+        :type       values:     Tuple[int, ...]
+        """
+        base = self._base
+        if min(addresses) < base or max(addresses) >= base + self._size:
+            raise KeyError('Register address outside of store')
+        regs = self._regs
+        present = self._present
+        for i in range(len(addresses)):
+            idx = addresses[i] - base
+            val = values[i]
+            regs[2 * idx] = (val >> 8) & 0xFF
+            regs[2 * idx + 1] = val & 0xFF
+            present[idx] = 1
 
     def get_hreg(self, address: int) -> Union[int, List[int]]:
         """
@@ -190,8 +337,9 @@ class Modbus(object):
         :returns:   Holding register value
         :rtype:     Union[int, List[int]]
         """
-        if address in self._register_dict:
-            return self._register_dict[address]
+        if self._has_hreg(address):
+            idx = 2 * (address - self._base)
+            return (self._regs[idx] << 8) | self._regs[idx + 1]
         else:
             raise KeyError('No value available for the register address {}'.
                            format(address))
@@ -203,5 +351,10 @@ class Modbus(object):
         :param      registers:         The registers
         :type       registers:         dict
         """
+        if self._size == 0:
+            base_addr = min(address for address, sz, value in registers)
+            end = max(address + sz for address, sz, value in registers)
+            self._allocate(base_addr, end - base_addr)
+
         for address, sz, value in registers:
             self.set_hreg(address=address, value=value)
@@ -13,6 +13,7 @@ from machine import UART
 from machine import Pin
 import struct
 import time
+import uasyncio as asyncio
 
 # custom packages
 from . import const as Const
@@ -110,6 +111,12 @@ class Serial(CommonModbusFunctions):
                           rx=pins[1]
                           )
 
+        # responses are awaited through the event loop
+        self._reader = asyncio.StreamReader(self._uart)
+
+        # scratch buffer for outgoing frames, address + largest PDU + CRC
+        self._tx = bytearray(1 + 253 + Const.CRC_LENGTH)
+
         if ctrl_pin is not None:
             self._ctrlPin = Pin(ctrl_pin, mode=Pin.OUT)
         else:
@@ -126,6 +133,9 @@ class Serial(CommonModbusFunctions):
         else:
             self._inter_frame_delay = 1750
 
+        # how long to wait for a slave response, in seconds
+        self._response_timeout = 120 * self._inter_frame_delay / 1000000
+
     def _calculate_crc16(self, data: bytearray) -> bytes:
         """
         Calculates the CRC16.
@@ -167,29 +177,29 @@ class Serial(CommonModbusFunctions):
 
         return True
 
-    def _uart_read(self) -> bytearray:
+    async def _uart_read(self) -> bytearray:
         """
         Read incoming slave response from UART
 
-        :returns:   Read content
+        Other tasks keep running while the response is on the wire.
+
+        :returns:   Read content, possibly incomplete on timeout
         :rtype:     bytearray
         """
         response = bytearray()
 
-        # TODO: use some kind of hint or user-configurable delay
-        #       to determine this loop counter
-        for x in range(1, 120):
-            if self._uart.any():
-                # WiPy only
-                # response.extend(self._uart.readall())
-                response.extend(self._uart.read())
-
-                # variable length function codes may require multiple reads
-                if self._exit_read(response):
-                    break
+        async def read_until_complete():
+            # variable length function codes may require multiple reads
+            while not self._exit_read(response):
+                r = await self._reader.read(256)
+                if r:
+                    response.extend(r)
 
-            # wait for the maximum time between two frames
-            time.sleep_us(self._inter_frame_delay)
+        try:
+            await asyncio.wait_for(read_until_complete(),
+                                   self._response_timeout)
+        except asyncio.TimeoutError:
+            pass
 
         return response
 
@@ -254,10 +264,13 @@ class Serial(CommonModbusFunctions):
         """
         # modbus_adu: Modbus Application Data Unit
         # consists of the Modbus PDU, with slave address prepended and checksum appended
-        modbus_adu = bytearray()
-        modbus_adu.append(slave_addr)
-        modbus_adu.extend(modbus_pdu)
-        modbus_adu.extend(self._calculate_crc16(modbus_adu))
+        tx = self._tx
+        size = 1 + len(modbus_pdu)
+        tx[0] = slave_addr
+        tx[1:size] = modbus_pdu
+        tx[size:size + Const.CRC_LENGTH] = self._calculate_crc16(
+            memoryview(tx)[:size])
+        modbus_adu = memoryview(tx)[:size + Const.CRC_LENGTH]
 
         if self._ctrlPin:
             self._ctrlPin.on()
@@ -291,10 +304,10 @@ class Serial(CommonModbusFunctions):
         if self._ctrlPin:
             self._ctrlPin.off()
 
-    def _send_receive(self,
-                      modbus_pdu: bytes,
-                      slave_addr: int,
-                      count: bool) -> bytes:
+    async def _send_receive(self,
+                            modbus_pdu: bytes,
+                            slave_addr: int,
+                            count: bool) -> bytes:
         """
         Send a modbus message and receive the reponse.
 
@@ -313,7 +326,7 @@ class Serial(CommonModbusFunctions):
 
         self._send(modbus_pdu=modbus_pdu, slave_addr=slave_addr)
 
-        return self._validate_resp_hdr(response=self._uart_read(),
+        return self._validate_resp_hdr(response=await self._uart_read(),
                                        slave_addr=slave_addr,
                                        function_code=modbus_pdu[0],
                                        count=count)
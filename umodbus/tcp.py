@@ -13,6 +13,7 @@
 import struct
 import socket
 import time
+import uasyncio as asyncio
 
 # custom packages
 from . import functions
@@ -22,7 +23,7 @@ from .common import ModbusException
 from .modbus import Modbus
 
 # typing not natively supported on MicroPython
-from .typing import Optional, Tuple, Union
+from .typing import Callable, Optional, Tuple, Union
 
 
 class ModbusTCP(Modbus):
@@ -63,6 +64,28 @@ class ModbusTCP(Modbus):
         except Exception:
             return False
 
+    async def serve(self,
+                    local_ip: str,
+                    local_port: int = 502,
+                    activity: Optional[Callable] = None) -> None:
+        """
+        Serve incoming requests from the event loop until the server closes
+
+        Unlike :py:meth:`process` this does not need to be polled, the
+        scheduler only runs it when a client has sent data.
+
+        :param      local_ip:    IP of this device listening for requests
+        :type       local_ip:    str
+        :param      local_port:  Port of this device
+        :type       local_port:  int
+        :param      activity:    Called with True before and False after
+                                 each request is processed
+        :type       activity:    Optional[Callable]
+        """
+        await self._itf.serve(local_ip, local_port,
+                              self._process_request, self._addr_list,
+                              activity)
+
 
 class TCP(CommonModbusFunctions):
     """
@@ -159,10 +182,10 @@ class TCP(CommonModbusFunctions):
 
         return response[hdr_length:]
 
-    def _send_receive(self,
-                      slave_addr: int,
-                      modbus_pdu: bytes,
-                      count: bool) -> bytes:
+    async def _send_receive(self,
+                            slave_addr: int,
+                            modbus_pdu: bytes,
+                            count: bool) -> bytes:
         """
         Send a modbus message and receive the reponse.
 
@@ -196,6 +219,8 @@ class TCPServer(object):
         self._sock = None
         self._client_sock = None
         self._is_bound = False
+        # scratch buffer for outgoing frames, MBAP header + largest PDU
+        self._tx = bytearray(Const.MBAP_HDR_LENGTH + 253)
 
     @property
     def is_bound(self) -> bool:
@@ -246,7 +271,10 @@ class TCPServer(object):
 
         self._is_bound = True
 
-    def _send(self, modbus_pdu: bytes, slave_addr: int) -> None:
+    def _send(self,
+              modbus_pdu: bytes,
+              slave_addr: int,
+              data: Optional[bytes] = None) -> None:
         """
         Send Modbus Protocol Data Unit to slave
 
@@ -254,11 +282,20 @@ class TCPServer(object):
         :type       modbus_pdu:  bytes
         :param      slave_addr:  The slave address
         :type       slave_addr:  int
+        :param      data:        Data appended to the PDU, copied straight
+                                 into the frame
+        :type       data:        Optional[bytes]
         """
         size = len(modbus_pdu)
-        fmt = 'B' * size
-        adu = struct.pack('>HHHB' + fmt, self._req_tid, 0, size + 1, slave_addr, *modbus_pdu)
-        self._client_sock.send(adu)
+        tx = self._tx
+        end = Const.MBAP_HDR_LENGTH + size
+        tx[Const.MBAP_HDR_LENGTH:end] = modbus_pdu
+        if data is not None:
+            size += len(data)
+            tx[end:Const.MBAP_HDR_LENGTH + size] = data
+            end = Const.MBAP_HDR_LENGTH + size
+        struct.pack_into('>HHHB', tx, 0, self._req_tid, 0, size + 1, slave_addr)
+        self._client_sock.write(memoryview(tx)[:end])
 
     def send_response(self,
                       slave_addr: int,
@@ -286,6 +323,12 @@ class TCPServer(object):
         :param      signed:                 Indicates if signed
         :type       signed:                 bool
         """
+        if isinstance(values, (bytes, bytearray, memoryview)):
+            # register bytes go into the frame without an intermediate PDU
+            self._send(struct.pack('>BB', function_code, len(values)),
+                       slave_addr, values)
+            return
+
         modbus_pdu = functions.response(function_code,
                                         request_register_addr,
                                         request_register_qty,
@@ -415,3 +458,77 @@ class TCPServer(object):
                     return None
         else:
             return self._accept_request(0, unit_addr_list)
+
+    async def serve(self,
+                    local_ip: str,
+                    local_port: int,
+                    handler: Callable,
+                    unit_addr_list: Optional[list] = None,
+                    activity: Optional[Callable] = None) -> None:
+        """
+        Accept clients and pass their requests to a handler as they arrive
+
+        :param      local_ip:        IP of this device listening for requests
+        :type       local_ip:        str
+        :param      local_port:      Port of this device
+        :type       local_port:      int
+        :param      handler:         Called with each decoded request
+        :type       handler:         Callable
+        :param      unit_addr_list:  The unit address list
+        :type       unit_addr_list:  Optional[list]
+        :param      activity:        Called with True before and False after
+                                     each request is processed
+        :type       activity:        Optional[Callable]
+        """
+        async def client(reader, writer):
+            try:
+                while True:
+                    req_header_no_uid = await reader.readexactly(
+                        Const.MBAP_HDR_LENGTH - 1)
+                    req_tid, req_pid, req_len = struct.unpack(
+                        '>HHH', req_header_no_uid)
+
+                    if req_pid != 0 or not (2 <= req_len <= 254):
+                        # print("Modbus request error: invalid header")
+                        break
+
+                    req_uid_and_pdu = await reader.readexactly(req_len)
+
+                    if ((unit_addr_list is not None) and
+                            (req_uid_and_pdu[0] not in unit_addr_list)):
+                        continue
+
+                    # Responses are written synchronously below, so no other
+                    # client can take over these between here and the drain
+                    self._req_tid = req_tid
+                    self._client_sock = writer
+
+                    if activity is not None:
+                        activity(True)
+
+                    try:
+                        handler(Request(self, req_uid_and_pdu))
+                    except ModbusException as e:
+                        self.send_exception_response(req_uid_and_pdu[0],
+                                                     e.function_code,
+                                                     e.exception_code)
+                    except Exception as e:
+                        print('Exception during execution: {}'.format(e))
+
+                    await writer.drain()
+
+                    if activity is not None:
+                        activity(False)
+            except (EOFError, OSError):
+                pass
+            finally:
+                if activity is not None:
+                    activity(False)
+                if self._client_sock is writer:
+                    self._client_sock = None
+                writer.close()
+                await writer.wait_closed()
+
+        server = await asyncio.start_server(client, local_ip, local_port)
+        self._is_bound = True
+        await server.wait_closed()
@@ -2,17 +2,29 @@ import uasyncio as asyncio
 import utime
 import machine
 import json
-from microdot_asyncio import Microdot, send_file, redirect
+from microdot_asyncio import Microdot, redirect
 
 web = Microdot()
 
+# The pages are small and static, so keep them in RAM rather than reading
+# them from flash on every request.
+def _load(filename):
+	with open(filename, "rb") as fp:
+		return fp.read()
+
+_HTML = {"Content-Type": "text/html; charset=UTF-8"}
+_INDEX = _load("index.html")
+_SETUP = _load("setup.html")
+_UPTIME_FMT = "I've been awake {} seconds".format
+_BOOT_TS = utime.time()
+
 @web.route('/')
 async def root(request):
-	return send_file("index.html")
+	return _INDEX, 200, _HTML
 
 @web.route('/uptime')
 async def uptime(request):
-    return "I've been awake {} seconds".format(int(utime.ticks_us()/1000000))
+    return _UPTIME_FMT(utime.time() - _BOOT_TS)
 
 @web.route("/setup", methods=["GET", "POST"])
 async def setup(request):
@@ -35,7 +47,7 @@ async def setup(request):
 					"om": om,
 				}, fp)
 		return redirect("/")
-	return send_file("setup.html") # , {"Content-Type": "text/html"}
+	return _SETUP, 200, _HTML
 
 @web.route("/reboot")
 async def reboot(request):